@@ -5,14 +5,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin
+import re
 import urllib.error
 import urllib.request
-import xml.etree.ElementTree as ET
+
+import lxml.html
+from lxml.etree import ParserError
+from lxml.html import HtmlElement
 
 
 DEFAULT_USER_AGENT = "BFSkinnerScraper/1.0"
 DEFAULT_TIMEOUT = 10
 
+# lxml rejects ``str`` input that still carries an XML encoding declaration.
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
 
 class ScraperError(RuntimeError):
     """Raised when the scraper cannot complete an operation."""
@@ -118,18 +125,18 @@ class Scraper:
         return payload.decode(encoding, errors="replace")
 
     # ------------------------------------------------------------------
-    def _parse_html(self, html: str) -> ET.Element:
+    def _parse_html(self, html: str) -> HtmlElement:
         try:
-            return ET.fromstring(html)
-        except ET.ParseError as exc:
+            return lxml.html.fromstring(_XML_DECLARATION_RE.sub("", html, count=1))
+        except ParserError as exc:
             raise ScraperError("Unable to parse listing HTML") from exc
 
     # ------------------------------------------------------------------
-    def _extract_articles(self, root: ET.Element) -> List[ArticleRecord]:
+    def _extract_articles(self, root: HtmlElement) -> List[ArticleRecord]:
         articles: List[ArticleRecord] = []
         seen_urls = set()
 
-        for article_el in root.findall(".//article"):
+        for article_el in root.iter("article"):
             title_el = article_el.find(".//h2")
             link_el = None
             if title_el is not None:
@@ -169,8 +176,8 @@ class Scraper:
         return articles
 
     # ------------------------------------------------------------------
-    def _find_next_link(self, root: ET.Element) -> Optional[str]:
-        for link in root.findall(".//a"):
+    def _find_next_link(self, root: HtmlElement) -> Optional[str]:
+        for link in root.iter("a"):
             rel = link.get("rel") or ""
             classes = link.get("class") or ""
             if self._contains_flag(rel, "next") or self._contains_flag(classes, "next"):
@@ -187,12 +194,7 @@ class Scraper:
 
     # ------------------------------------------------------------------
     @staticmethod
-    def _text_content(element: Optional[ET.Element]) -> str:
+    def _text_content(element: Optional[HtmlElement]) -> str:
         if element is None:
             return ""
-        parts: List[str] = [element.text or ""]
-        for child in element:
-            parts.append(Scraper._text_content(child))
-            if child.tail:
-                parts.append(child.tail)
-        return "".join(parts).strip()
+        return element.text_content().strip()
@@ -0,0 +1,56 @@
+# mypy: check-untyped-defs
+"""Per-anchor URL helpers kept free of class state so they can be compiled.
+
+Everything here is fully annotated so ``mypyc bfskinner_scraper/_fastpath.py``
+can build it as a C extension. When the extension is absent, Python imports
+this module as plain source and behaviour is unchanged.
+"""
+from __future__ import annotations
+
+import functools
+import re
+import sys
+from typing import Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+_URL_RE = re.compile(
+    r"^(?P<scheme>https?)://(?P<netloc>[^/?#]+)(?P<path>[^?#]*)(?P<query>\?[^#]+)?",
+    re.I,
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_url(url: str) -> str:
+    """Drop the fragment from ``url``, memoized as pages repeat the same links."""
+    match = _URL_RE.match(url)
+    if not match:
+        return url
+    path = match["path"] or "/"
+    return f"{match['scheme'].lower()}://{match['netloc']}{path}{match['query'] or ''}"
+
+
+def is_internal_url(url: str, base_netloc: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.netloc == base_netloc or (not parsed.netloc and bool(parsed.path))
+
+
+def classify_resource(
+    resource_url: str,
+    anchor_text: str,
+    base_netloc: str,
+    extensions: Tuple[str, ...],
+    keyword_hints: Pattern[str],
+) -> Optional[str]:
+    parsed = urlparse(resource_url)
+    if not parsed.scheme.startswith("http"):
+        return None
+
+    lower_path = parsed.path.lower()
+    if lower_path.endswith(extensions):
+        # Interned so every record shares one string per resource type.
+        return sys.intern(lower_path.rsplit(".", 1)[1])
+
+    lower_text = (anchor_text or "").lower()
+    if keyword_hints.search(lower_text) and is_internal_url(resource_url, base_netloc):
+        return "page"
+    return None
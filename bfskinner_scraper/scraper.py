@@ -1,20 +1,89 @@
 """Scraper implementation for bfskinner.org free resources."""
 from __future__ import annotations
 
+import asyncio
+import codecs
+import functools
 import logging
+import multiprocessing
+import re
 import time
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import Iterable, Iterator, List, Optional, Set
+from typing import Iterable, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
+import aiohttp
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml.etree import HTMLPullParser, XPath, ParserError, XMLSyntaxError
+from lxml.html import HtmlElement
+from urllib3.util.retry import Retry
+
+from ._fastpath import classify_resource, is_internal_url, normalize_url
 
 logger = logging.getLogger(__name__)
 
+_ANCHORS_WITH_HREF = XPath(".//a[@href]")
+# Visible text only: BeautifulSoup's get_text left script and style contents out.
+_VISIBLE_TEXT = XPath("descendant-or-self::text()[not(ancestor::script or ancestor::style)]")
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+
+
+def _header_charset(content_type: str) -> Optional[str]:
+    """Return the charset declared in a ``Content-Type`` header, if any.
+
+    Unknown charset names yield ``None`` so lxml sniffs the document instead.
+    """
+    match = _CHARSET_RE.search(content_type)
+    if not match:
+        return None
+    try:
+        codecs.lookup(match.group(1))
+    except LookupError:
+        return None
+    return match.group(1)
+
+
+@functools.lru_cache(maxsize=None)
+def _html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    return lxml.html.HTMLParser(encoding=encoding)
+
+
+class _TokenBucket:
+    """Pace requests to ``rate`` per second, allowing bursts of ``capacity``.
+
+    Callers reserve a token up front and only wait off the deficit, so time
+    spent parsing since the previous request counts towards the delay.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ResourceRecord:
     """Representation of a free resource discovered on the site."""
 
@@ -71,9 +140,16 @@ class BFSkinnerScraper:
         "User-Agent": (
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/117.0 Safari/537.36"
-        )
+        ),
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
     }
 
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    CHUNK_SIZE = 16384
+
     def __init__(
         self,
         base_url: str = "https://www.bfskinner.org/",
@@ -82,144 +158,309 @@ class BFSkinnerScraper:
         max_pages: int = 200,
         request_delay: float = 0.5,
         timeout: int = 30,
+        concurrency: int = 8,
+        parse_workers: Optional[int] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/") + "/"
-        self.session = session or requests.Session()
-        self.session.headers.update(self.DEFAULT_HEADERS)
         self.max_pages = max_pages
+        self.session = session or self._build_session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
         self.request_delay = request_delay
         self.timeout = timeout
+        self.concurrency = concurrency
+        self.parse_workers = parse_workers
         self._visited: Set[str] = set()
+        self._base_netloc = urlparse(self.base_url).netloc
+        self._ext_tuple = tuple(ext.lower() for ext in self.RESOURCE_EXTENSIONS)
+        self._hint_re = re.compile(
+            "|".join(re.escape(keyword) for keyword in sorted(self.KEYWORD_HINTS))
+        )
 
     def crawl(self) -> List[ResourceRecord]:
         """Execute the crawl starting at ``base_url``."""
         queue: deque[str] = deque([self.base_url])
+        queued: Set[str] = {self.base_url}
         resources: List[ResourceRecord] = []
+        rate_limit = _TokenBucket(1 / self.request_delay) if self.request_delay else None
 
         while queue and len(self._visited) < self.max_pages:
             url = queue.popleft()
             if url in self._visited:
                 continue
+            if rate_limit is not None:
+                rate_limit.acquire()
             logger.debug("Fetching %s", url)
             try:
-                html = self._fetch(url)
+                page = self._fetch_and_parse(url)
             except requests.RequestException as exc:
                 logger.warning("Failed to fetch %s: %s", url, exc)
                 continue
 
             self._visited.add(url)
-            if html is None:
+            if page is None:
                 continue
 
-            soup = BeautifulSoup(html, "html.parser")
-            page_title = self._extract_page_title(soup)
-            resources.extend(self._extract_resources(url, page_title, soup))
-
-            for link in self._extract_internal_links(url, soup):
-                if link not in self._visited and link not in queue:
+            page_resources, links = self._extract_page(url, *page)
+            resources.extend(page_resources)
+            for link in links:
+                if link not in self._visited and link not in queued:
+                    queued.add(link)
                     queue.append(link)
 
-            if self.request_delay:
-                time.sleep(self.request_delay)
+        return resources
+
+    async def crawl_async(self) -> List[ResourceRecord]:
+        """Execute the crawl with concurrent requests using ``aiohttp``.
+
+        Pages are expanded level by level: every URL in the current frontier is
+        fetched concurrently with at most ``concurrency`` requests in flight,
+        paced to ``concurrency`` requests per ``request_delay`` seconds. When
+        ``parse_workers`` is set, the pages of each level are parsed in parallel
+        in a process pool of that size instead of on the event loop thread.
+        """
+        frontier: List[str] = [self.base_url]
+        queued: Set[str] = {self.base_url}
+        resources: List[ResourceRecord] = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        rate_limit = (
+            _TokenBucket(self.concurrency / self.request_delay, capacity=self.concurrency)
+            if self.request_delay
+            else None
+        )
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency)
+        parse_pool = (
+            ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                # Workers start after aiohttp's resolver threads exist, so never fork.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(type(self), self.base_url),
+            )
+            if self.parse_workers
+            else None
+        )
+
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers=self.DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as session:
+                while frontier and len(self._visited) < self.max_pages:
+                    batch = frontier[: self.max_pages - len(self._visited)]
+                    results = await asyncio.gather(
+                        *(
+                            self._fetch_async(session, semaphore, rate_limit, url)
+                            for url in batch
+                        ),
+                        return_exceptions=True,
+                    )
+
+                    pages: List[Tuple[str, Tuple[bytes, Optional[str]]]] = []
+                    for url, result in zip(batch, results):
+                        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+                            logger.warning("Failed to fetch %s: %s", url, result)
+                            continue
+                        if isinstance(result, BaseException):
+                            raise result
+
+                        self._visited.add(url)
+                        if result is not None:
+                            pages.append((url, result))
+
+                    # URLs cut from this batch by max_pages are already queued; keep them.
+                    frontier = frontier[len(batch) :]
+                    for page_resources, links in await self._scrape_pages(pages, parse_pool):
+                        resources.extend(page_resources)
+                        for link in links:
+                            if link not in self._visited and link not in queued:
+                                queued.add(link)
+                                frontier.append(link)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
 
         return resources
 
     # ------------------------------------------------------------------
-    def _fetch(self, url: str) -> Optional[str]:
-        response = self.session.get(url, timeout=self.timeout)
-        if not response.ok:
-            logger.warning("Non-200 response for %s: %s", url, response.status_code)
+    def _build_session(self) -> requests.Session:
+        """Create a session whose pool keeps same-host connections alive."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(32, self.max_pages),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=self.RETRY_STATUSES,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _fetch_and_parse(self, url: str) -> Optional[Tuple[Optional[str], List[HtmlElement]]]:
+        """Stream ``url`` into an incremental parser.
+
+        Chunks are fed to lxml as they arrive so parsing overlaps the download,
+        and anchors are collected from the parser's events as they close rather
+        than by walking the finished tree. Returns ``(page_title, anchors)``.
+        """
+        with self.session.get(url, stream=True, timeout=self.timeout) as response:
+            if not response.ok:
+                logger.warning("Non-200 response for %s: %s", url, response.status_code)
+                return None
+            content_type = response.headers.get("Content-Type", "")
+            if "text/html" not in content_type:
+                logger.debug("Skipping non-HTML content at %s", url)
+                return None
+
+            parser = HTMLPullParser(
+                events=("end",), tag="a", encoding=_header_charset(content_type)
+            )
+            parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+            anchors: List[HtmlElement] = []
+            for chunk in response.iter_content(self.CHUNK_SIZE):
+                parser.feed(chunk)
+                anchors.extend(anchor for _, anchor in parser.read_events())
+
+        try:
+            root = parser.close()
+        except XMLSyntaxError as exc:
+            logger.warning("Failed to parse %s: %s", url, exc)
             return None
-        if "text/html" not in response.headers.get("Content-Type", ""):
-            logger.debug("Skipping non-HTML content at %s", url)
+        anchors.extend(anchor for _, anchor in parser.read_events())
+        if root is None:
             return None
-        return response.text
+        anchors = [anchor for anchor in anchors if anchor.get("href") is not None]
+        return self._extract_page_title(root), anchors
 
-    def _extract_internal_links(self, page_url: str, soup: BeautifulSoup) -> Iterator[str]:
-        for anchor in soup.find_all("a", href=True):
-            href = anchor.get("href")
-            if not href:
-                continue
-            absolute = urljoin(page_url, href)
-            if self._is_internal_url(absolute):
-                cleaned = self._normalize_url(absolute)
-                if cleaned:
-                    yield cleaned
-
-    def _extract_resources(
-        self, page_url: str, page_title: Optional[str], soup: BeautifulSoup
-    ) -> List[ResourceRecord]:
+    async def _fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        rate_limit: Optional[_TokenBucket],
+        url: str,
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        if rate_limit is not None:
+            await rate_limit.acquire_async()
+        async with semaphore:
+            logger.debug("Fetching %s", url)
+            async with session.get(url) as response:
+                content_type = response.headers.get("Content-Type", "")
+                if not response.ok:
+                    logger.warning("Non-200 response for %s: %s", url, response.status)
+                    page = None
+                elif "text/html" not in content_type:
+                    logger.debug("Skipping non-HTML content at %s", url)
+                    page = None
+                else:
+                    page = await response.read(), _header_charset(content_type)
+        return page
+
+    def _scrape_page(
+        self, page_url: str, html: bytes, encoding: Optional[str] = None
+    ) -> Tuple[List[ResourceRecord], List[str]]:
+        """Parse ``html`` and return the resources and internal links it contains.
+
+        The body is handed to lxml undecoded; ``encoding`` is the charset from the
+        HTTP headers and, when absent, lxml sniffs the document itself.
+        """
+        try:
+            root = lxml.html.document_fromstring(html, parser=_html_parser(encoding))
+        except ParserError as exc:
+            logger.warning("Failed to parse %s: %s", page_url, exc)
+            return [], []
+
+        return self._extract_page(
+            page_url, self._extract_page_title(root), _ANCHORS_WITH_HREF(root)
+        )
+
+    async def _scrape_pages(
+        self,
+        pages: List[Tuple[str, Tuple[bytes, Optional[str]]]],
+        parse_pool: Optional[ProcessPoolExecutor],
+    ) -> List[Tuple[List[ResourceRecord], List[str]]]:
+        if parse_pool is None:
+            return [self._scrape_page(url, *page) for url, page in pages]
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(parse_pool, _scrape_page_in_worker, url, *page)
+                for url, page in pages
+            )
+        )
+
+    def _extract_page(
+        self, page_url: str, page_title: Optional[str], anchors: Iterable[HtmlElement]
+    ) -> Tuple[List[ResourceRecord], List[str]]:
+        """Return the resources and internal links found in a single pass over ``anchors``."""
         resources: List[ResourceRecord] = []
-        for anchor in soup.find_all("a", href=True):
+        links: List[str] = []
+        seen: Set[Tuple[str, str]] = set()
+        normalized_page_url = self._normalize_url(page_url)
+        for anchor in anchors:
             href = anchor.get("href")
-            text = anchor.get_text(" ", strip=True)
             if not href:
                 continue
 
-            resource_url = urljoin(page_url, href)
-            resource_type = self._classify_resource(resource_url, text)
+            absolute = urljoin(page_url, href)
+            normalized = self._normalize_url(absolute)
+            text = self._text_content(anchor)
+            resource_type = self._classify_resource(absolute, text)
+            # Downloads are classified from their extension alone; only pages are crawled.
+            if resource_type in (None, "page") and normalized and self._is_internal_url(absolute):
+                links.append(normalized)
             if resource_type is None:
                 continue
 
-            description = self._derive_description(anchor)
-            record = ResourceRecord(
-                page_url=self._normalize_url(page_url),
-                resource_url=self._normalize_url(resource_url),
-                resource_title=text or (page_title or ""),
-                resource_type=resource_type,
-                page_title=page_title,
-                description=description,
+            key = (normalized, resource_type)
+            if key in seen:
+                continue
+            seen.add(key)
+            resources.append(
+                ResourceRecord(
+                    page_url=normalized_page_url,
+                    resource_url=normalized,
+                    resource_title=text or (page_title or ""),
+                    resource_type=resource_type,
+                    page_title=page_title,
+                    description=self._derive_description(anchor),
+                )
             )
-            if record not in resources:
-                resources.append(record)
-        return resources
+        return resources, links
 
     # ------------------------------------------------------------------
     def _classify_resource(self, resource_url: str, anchor_text: str) -> Optional[str]:
-        parsed = urlparse(resource_url)
-        if not parsed.scheme.startswith("http"):
-            return None
-
-        lower_path = parsed.path.lower()
-        for ext in self.RESOURCE_EXTENSIONS:
-            if lower_path.endswith(ext):
-                return ext.lstrip(".")
-
-        lower_text = (anchor_text or "").lower()
-        if any(keyword in lower_text for keyword in self.KEYWORD_HINTS):
-            if self._is_internal_url(resource_url):
-                return "page"
-        return None
+        return classify_resource(
+            resource_url, anchor_text, self._base_netloc, self._ext_tuple, self._hint_re
+        )
 
     @staticmethod
-    def _derive_description(anchor) -> Optional[str]:
+    def _derive_description(anchor: HtmlElement) -> Optional[str]:
         """Attempt to capture a short description near the anchor."""
-        parent = anchor.find_parent(["p", "li", "div"])
-        if parent:
-            text = parent.get_text(" ", strip=True)
+        parent = next(anchor.iterancestors("p", "li", "div"), None)
+        if parent is not None:
+            text = BFSkinnerScraper._text_content(parent)
             if text:
                 return text
-        return anchor.get_text(" ", strip=True) or None
+        return BFSkinnerScraper._text_content(anchor) or None
+
+    @staticmethod
+    def _text_content(element: HtmlElement) -> str:
+        """Return the element's stripped visible text pieces joined by single spaces."""
+        return " ".join(piece for piece in map(str.strip, _VISIBLE_TEXT(element)) if piece)
 
     def _is_internal_url(self, url: str) -> bool:
-        parsed = urlparse(url)
-        base = urlparse(self.base_url)
-        return parsed.netloc == base.netloc or (not parsed.netloc and parsed.path)
+        return is_internal_url(url, self._base_netloc)
 
-    @staticmethod
-    def _normalize_url(url: str) -> str:
-        parsed = urlparse(url)
-        scheme = parsed.scheme or "https"
-        netloc = parsed.netloc
-        path = parsed.path or "/"
-        query = f"?{parsed.query}" if parsed.query else ""
-        fragment = ""
-        return f"{scheme}://{netloc}{path}{query}{fragment}" if netloc else url
+    _normalize_url = staticmethod(normalize_url)
 
     @staticmethod
-    def _extract_page_title(soup: BeautifulSoup) -> Optional[str]:
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+    def _extract_page_title(root: HtmlElement) -> Optional[str]:
+        title = root.findtext(".//title")
+        if title and title.strip():
+            return title.strip()
         return None
 
     # ------------------------------------------------------------------
@@ -235,4 +476,20 @@ class BFSkinnerScraper:
         return pd.DataFrame(data)
 
 
+# ----------------------------------------------------------------------
+# Process pool workers used by ``crawl_async`` when ``parse_workers`` is set.
+_worker_scraper: Optional[BFSkinnerScraper] = None
+
+
+def _init_parse_worker(scraper_cls: type, base_url: str) -> None:
+    global _worker_scraper
+    _worker_scraper = scraper_cls(base_url)
+
+
+def _scrape_page_in_worker(
+    page_url: str, html: bytes, encoding: Optional[str]
+) -> Tuple[List[ResourceRecord], List[str]]:
+    return _worker_scraper._scrape_page(page_url, html, encoding)  # type: ignore[union-attr]
+
+
 __all__ = ["BFSkinnerScraper", "ResourceRecord"]
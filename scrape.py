@@ -5,6 +5,7 @@ import argparse
 import csv
 import json
 import logging
+import textwrap
 from pathlib import Path
 from typing import Iterable
 
@@ -50,9 +51,7 @@ def parse_args() -> argparse.Namespace:
 
 def export_csv(path: Path, resources: Iterable[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    resources = list(resources)
-    if not resources:
-        logging.warning("No resources found; writing empty CSV to %s", path)
+    count = 0
     with path.open("w", newline="", encoding="utf-8") as csvfile:
         writer = csv.DictWriter(
             csvfile,
@@ -66,13 +65,28 @@ def export_csv(path: Path, resources: Iterable[dict]) -> None:
             ],
         )
         writer.writeheader()
-        writer.writerows(resources)
+        for resource in resources:
+            writer.writerow(resource)
+            count += 1
+    if not count:
+        logging.warning("No resources found; wrote empty CSV to %s", path)
 
 
 def export_json(path: Path, resources: Iterable[dict]) -> None:
+    """Write ``resources`` as a JSON array one item at a time.
+
+    The output matches ``json.dump(list(resources), indent=2)`` without holding
+    the whole list in memory.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as jsonfile:
-        json.dump(list(resources), jsonfile, indent=2, ensure_ascii=False)
+        separator = "[\n"
+        for resource in resources:
+            jsonfile.write(separator)
+            item = json.dumps(resource, indent=2, ensure_ascii=False)
+            jsonfile.write(textwrap.indent(item, "  "))
+            separator = ",\n"
+        jsonfile.write("[]" if separator == "[\n" else "\n]")
 
 
 def main() -> None:
@@ -88,13 +102,12 @@ def main() -> None:
         "Starting crawl of %s (max_pages=%s)", scraper.base_url, args.max_pages
     )
     resources = scraper.crawl()
-    resource_dicts = [record.as_dict() for record in resources]
 
-    export_csv(args.output, resource_dicts)
+    export_csv(args.output, (record.as_dict() for record in resources))
     if args.json_output:
-        export_json(args.json_output, resource_dicts)
+        export_json(args.json_output, (record.as_dict() for record in resources))
 
-    logging.info("Scraping complete. %s resources captured.", len(resource_dicts))
+    logging.info("Scraping complete. %s resources captured.", len(resources))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,331 @@
+import asyncio
+from unittest import mock
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from bfskinner_scraper import BFSkinnerScraper, ResourceRecord
+from bfskinner_scraper.scraper import _TokenBucket, _header_charset
+
+
+def make_response(
+    html: str, *, content_type: str = "text/html", charset: str = "utf-8", status: int = 200
+):
+    body = html.encode(charset)
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.ok = status < 400
+    response.status_code = status
+    response.headers = {"Content-Type": f"{content_type}; charset={charset}"}
+    response.iter_content.side_effect = lambda size: (
+        body[start : start + size] for start in range(0, len(body), size)
+    )
+    return response
+
+
+def make_session(pages):
+    session = mock.Mock()
+    session.headers = {}
+    session.get.side_effect = lambda url, **kwargs: pages[url]
+    return session
+
+
+HOME = """
+<html>
+    <head><title> Home </title></head>
+    <body>
+        <ul>
+            <li>Read the <a href="/papers/verbal.pdf">Verbal Behavior</a> paper.</li>
+            <li><a href="https://www.bfskinner.org/about/">About</a></li>
+        </ul>
+        <p><a href="/free-handouts/">Free handouts</a> for teachers.</p>
+        <a href="https://example.com/other.pdf">External</a>
+    </body>
+</html>
+"""
+
+ABOUT = """
+<html>
+    <head><title>About</title></head>
+    <body><a href="/">Home</a></body>
+</html>
+"""
+
+
+@pytest.fixture
+def scraper():
+    pages = {
+        "https://www.bfskinner.org/": make_response(HOME),
+        "https://www.bfskinner.org/about/": make_response(ABOUT),
+        "https://www.bfskinner.org/free-handouts/": make_response("<html><body></body></html>"),
+    }
+    return BFSkinnerScraper(session=make_session(pages), request_delay=0)
+
+
+def test_crawl_collects_resources_from_each_page(scraper):
+    resources = scraper.crawl()
+
+    assert resources == [
+        ResourceRecord(
+            page_url="https://www.bfskinner.org/",
+            resource_url="https://www.bfskinner.org/papers/verbal.pdf",
+            resource_title="Verbal Behavior",
+            resource_type="pdf",
+            page_title="Home",
+            description="Read the Verbal Behavior paper.",
+        ),
+        ResourceRecord(
+            page_url="https://www.bfskinner.org/",
+            resource_url="https://www.bfskinner.org/free-handouts/",
+            resource_title="Free handouts",
+            resource_type="page",
+            page_title="Home",
+            description="Free handouts for teachers.",
+        ),
+        ResourceRecord(
+            page_url="https://www.bfskinner.org/",
+            resource_url="https://example.com/other.pdf",
+            resource_title="External",
+            resource_type="pdf",
+            page_title="Home",
+            description="External",
+        ),
+    ]
+
+
+def test_crawl_parses_pages_fed_in_small_chunks(scraper):
+    expected = BFSkinnerScraper(session=scraper.session, request_delay=0).crawl()
+    scraper.CHUNK_SIZE = 5
+
+    assert scraper.crawl() == expected
+
+
+def test_crawl_visits_internal_links_once(scraper):
+    scraper.crawl()
+
+    fetched = [call.args[0] for call in scraper.session.get.call_args_list]
+    assert len(fetched) == len(set(fetched))
+    assert "https://www.bfskinner.org/about/" in fetched
+    assert "https://www.bfskinner.org/papers/verbal.pdf" not in fetched
+    assert "https://example.com/other.pdf" not in fetched
+
+
+def test_crawl_respects_max_pages(scraper):
+    scraper.max_pages = 1
+
+    scraper.crawl()
+
+    assert scraper.session.get.call_count == 1
+
+
+def test_crawl_skips_unparseable_pages():
+    pages = {"https://www.bfskinner.org/": make_response("")}
+    scraper = BFSkinnerScraper(session=make_session(pages), request_delay=0)
+
+    assert scraper.crawl() == []
+
+
+def test_crawl_keeps_first_anchor_for_repeated_resources():
+    html = """
+    <html><body>
+        <p><a href="/papers/verbal.pdf">Verbal Behavior</a></p>
+        <p><a href="/papers/verbal.pdf#page=2">Download the PDF again</a></p>
+    </body></html>
+    """
+    pages = {"https://www.bfskinner.org/": make_response(html)}
+    scraper = BFSkinnerScraper(session=make_session(pages), max_pages=1, request_delay=0)
+
+    resources = scraper.crawl()
+
+    assert [record.resource_title for record in resources] == ["Verbal Behavior"]
+
+
+def test_crawl_separates_text_of_nested_inline_tags():
+    html = '<html><body><p>Get <a href="/guide.pdf">a<b>PDF</b>guide</a>now</p></body></html>'
+    pages = {"https://www.bfskinner.org/": make_response(html)}
+    scraper = BFSkinnerScraper(session=make_session(pages), max_pages=1, request_delay=0)
+
+    [record] = scraper.crawl()
+
+    assert record.resource_title == "a PDF guide"
+    assert record.description == "Get a PDF guide now"
+
+
+def test_crawl_leaves_script_and_style_out_of_descriptions():
+    html = (
+        "<html><body><div><script>var x=1;</script><style>a { color: red }</style>"
+        '<a href="/a.pdf">Doc</a> text</div></body></html>'
+    )
+    pages = {"https://www.bfskinner.org/": make_response(html)}
+    scraper = BFSkinnerScraper(session=make_session(pages), max_pages=1, request_delay=0)
+
+    [record] = scraper.crawl()
+
+    assert record.resource_title == "Doc"
+    assert record.description == "Doc text"
+
+
+def test_crawl_decodes_pages_using_header_charset():
+    html = (
+        "<html><head><title>Caf\u00e9 Skinner</title></head>"
+        "<body><a href='/notes.pdf'>R\u00e9sum\u00e9</a></body></html>"
+    )
+    pages = {
+        "https://www.bfskinner.org/": make_response(html, charset="windows-1252")
+    }
+    scraper = BFSkinnerScraper(session=make_session(pages), max_pages=1, request_delay=0)
+
+    [record] = scraper.crawl()
+
+    assert record.page_title == "Caf\u00e9 Skinner"
+    assert record.resource_title == "R\u00e9sum\u00e9"
+
+
+@pytest.mark.parametrize("charset", ["utf8mb4", "x-user-defined", "none"])
+def test_scrape_page_ignores_unknown_header_charsets(charset):
+    html = b"<html><head><title>Home</title></head><body><a href='/notes.pdf'>Notes</a></body></html>"
+    scraper = BFSkinnerScraper(session=make_session({}), request_delay=0)
+
+    encoding = _header_charset(f"text/html; charset={charset}")
+    [record], _ = scraper._scrape_page(scraper.base_url, html, encoding)
+
+    assert encoding is None
+    assert record.resource_title == "Notes"
+
+
+def test_scrape_page_keeps_anchor_that_is_the_only_body_child():
+    html = b"<?xml version='1.0' encoding='utf-8'?><html><body><a href='/x.pdf'>d</a></body></html>"
+    scraper = BFSkinnerScraper(session=make_session({}), request_delay=0)
+
+    resources, links = scraper._scrape_page(scraper.base_url, html)
+
+    assert [record.resource_url for record in resources] == ["https://www.bfskinner.org/x.pdf"]
+    assert links == []
+
+
+@pytest.mark.parametrize("charset", ["utf8mb4", "x-user-defined", "none"])
+def test_crawl_ignores_unknown_header_charsets(charset):
+    html = "<html><head><title>Home</title></head><body><a href='/notes.pdf'>Notes</a></body></html>"
+    response = make_response(html)
+    response.headers = {"Content-Type": f"text/html; charset={charset}"}
+    pages = {"https://www.bfskinner.org/": response}
+    scraper = BFSkinnerScraper(session=make_session(pages), max_pages=1, request_delay=0)
+
+    [record] = scraper.crawl()
+
+    assert record.page_title == "Home"
+    assert record.resource_title == "Notes"
+
+
+def test_token_bucket_only_waits_off_the_remaining_delay():
+    clock = {"now": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    with mock.patch("time.monotonic", lambda: clock["now"]), mock.patch("time.sleep", fake_sleep):
+        bucket = _TokenBucket(rate=2.0)
+        bucket.acquire()
+        clock["now"] += 0.2
+        bucket.acquire()
+        bucket.acquire()
+
+    assert sleeps == pytest.approx([0.3, 0.5])
+
+
+@pytest.mark.parametrize("max_pages, pool_size", [(5, 32), (50, 50)])
+def test_default_session_pools_and_retries_connections(max_pages, pool_size):
+    scraper = BFSkinnerScraper(max_pages=max_pages)
+
+    adapter = scraper.session.get_adapter(scraper.base_url)
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == pool_size
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert scraper.session.headers["Connection"] == "keep-alive"
+
+
+@pytest.mark.parametrize("parse_workers", [None, 2])
+def test_crawl_async_fetches_frontier_concurrently(parse_workers):
+    site = {
+        "/": HOME.replace("https://www.bfskinner.org/about/", "/about/"),
+        "/about/": ABOUT,
+        "/free-handouts/": "<html><body></body></html>",
+    }
+
+    async def handler(request):
+        if request.path not in site:
+            return web.Response(body=b"%PDF", content_type="application/pdf")
+        return web.Response(text=site[request.path], content_type="text/html")
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        server = web.TCPSite(runner, "127.0.0.1", 0)
+        await server.start()
+        port = runner.addresses[0][1]
+        try:
+            scraper = BFSkinnerScraper(
+                f"http://127.0.0.1:{port}/", request_delay=0, parse_workers=parse_workers
+            )
+            return scraper, await scraper.crawl_async()
+        finally:
+            await runner.cleanup()
+
+    scraper, resources = asyncio.run(run())
+
+    base = scraper.base_url
+    assert [(record.resource_url, record.resource_type) for record in resources] == [
+        (f"{base}papers/verbal.pdf", "pdf"),
+        (f"{base}free-handouts/", "page"),
+        ("https://example.com/other.pdf", "pdf"),
+    ]
+    assert scraper._visited == {
+        base,
+        f"{base}about/",
+        f"{base}free-handouts/",
+    }
+
+
+def test_crawl_async_keeps_unfetched_frontier_after_failures():
+    links = "".join(f"<a href='/{name}/'>{name}</a>" for name in "abcd")
+    pages = {"https://www.bfskinner.org/": f"<html><body>{links}</body></html>".encode()}
+    fetched = []
+
+    async def fake_fetch(session, semaphore, rate_limit, url):
+        fetched.append(url)
+        if url.endswith("/a/"):
+            raise aiohttp.ClientConnectionError("connection reset")
+        return pages.get(url, b"<html><body></body></html>"), "utf-8"
+
+    scraper = BFSkinnerScraper(max_pages=3, request_delay=0)
+    scraper._fetch_async = fake_fetch
+
+    asyncio.run(scraper.crawl_async())
+
+    assert fetched == [
+        "https://www.bfskinner.org/",
+        "https://www.bfskinner.org/a/",
+        "https://www.bfskinner.org/b/",
+        "https://www.bfskinner.org/c/",
+    ]
+    assert len(scraper._visited) == 3
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.bfskinner.org", "https://www.bfskinner.org/"),
+        ("HTTPS://www.bfskinner.org/about/#team", "https://www.bfskinner.org/about/"),
+        ("https://www.bfskinner.org/search?q=pdf#results", "https://www.bfskinner.org/search?q=pdf"),
+        ("https://www.bfskinner.org/search?#results", "https://www.bfskinner.org/search"),
+        ("mailto:info@bfskinner.org", "mailto:info@bfskinner.org"),
+    ],
+)
+def test_normalize_url_drops_fragments(url, expected):
+    assert BFSkinnerScraper._normalize_url(url) == expected
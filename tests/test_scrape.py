@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+import logging
+
+import pytest
+
+from scrape import export_csv, export_json
+
+FIELDNAMES = [
+    "page_url",
+    "page_title",
+    "resource_url",
+    "resource_title",
+    "resource_type",
+    "description",
+]
+
+ROWS = [
+    {
+        "page_url": "https://www.bfskinner.org/",
+        "page_title": "Home",
+        "resource_url": "https://www.bfskinner.org/papers/verbal.pdf",
+        "resource_title": "Verbal Behavior",
+        "resource_type": "pdf",
+        "description": "Read the Verbal Behavior paper.",
+    },
+    {
+        "page_url": "https://www.bfskinner.org/",
+        "page_title": None,
+        "resource_url": "https://www.bfskinner.org/café/",
+        "resource_title": "Café, \"quoted\"\nhandout",
+        "resource_type": "page",
+        "description": None,
+    },
+]
+
+
+def expected_csv(rows):
+    buffer = io.StringIO(newline="")
+    writer = csv.DictWriter(buffer, fieldnames=FIELDNAMES)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("rows", [[], ROWS])
+def test_export_json_matches_json_dump(tmp_path, rows):
+    path = tmp_path / "out" / "resources.json"
+
+    export_json(path, (row for row in rows))
+
+    assert path.read_text(encoding="utf-8") == json.dumps(
+        list(rows), indent=2, ensure_ascii=False
+    )
+
+
+def test_export_csv_streams_rows(tmp_path, caplog):
+    path = tmp_path / "out" / "resources.csv"
+
+    with caplog.at_level(logging.WARNING):
+        export_csv(path, (row for row in ROWS))
+
+    with path.open(newline="", encoding="utf-8") as csvfile:
+        assert csvfile.read() == expected_csv(ROWS)
+    assert "No resources found" not in caplog.text
+
+
+def test_export_csv_warns_and_writes_header_when_empty(tmp_path, caplog):
+    path = tmp_path / "resources.csv"
+
+    with caplog.at_level(logging.WARNING):
+        export_csv(path, iter([]))
+
+    with path.open(newline="", encoding="utf-8") as csvfile:
+        assert csvfile.read() == expected_csv([])
+    assert f"No resources found; wrote empty CSV to {path}" in caplog.text
@@ -74,11 +74,44 @@ def test_parse_listing_skips_incomplete_articles(html):
     assert next_link is None
 
 
-def test_parse_listing_rejects_invalid_html():
+def test_parse_listing_tolerates_unclosed_tags():
+    scraper = Scraper("https://example.com")
+
+    articles, next_link = scraper.parse_listing(
+        "<html><body><article><h2><a href='/unclosed'>Unclosed article</a></h2><p>Summary"
+    )
+
+    assert articles == [
+        ArticleRecord(
+            title="Unclosed article",
+            url="https://example.com/unclosed",
+            summary="Summary",
+        )
+    ]
+    assert next_link is None
+
+
+def test_parse_listing_accepts_xhtml_with_xml_declaration():
+    html = """<?xml version="1.0" encoding="utf-8"?>
+    <html xmlns="http://www.w3.org/1999/xhtml">
+        <body>
+            <article><h2><a href="/xhtml">XHTML article</a></h2></article>
+        </body>
+    </html>
+    """
+    scraper = Scraper("https://example.com")
+
+    articles, next_link = scraper.parse_listing(html)
+
+    assert articles == [ArticleRecord(title="XHTML article", url="https://example.com/xhtml")]
+    assert next_link is None
+
+
+def test_parse_listing_rejects_empty_document():
     scraper = Scraper("https://example.com")
 
     with pytest.raises(ScraperError):
-        scraper.parse_listing("<html><body><article>")
+        scraper.parse_listing("")
 
 
 def test_fetch_success():